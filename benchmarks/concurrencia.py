@@ -0,0 +1,145 @@
+"""
+Benchmark de concurrencia para GET /api/inventario/{item_id}
+
+Lanza N clientes concurrentes (hilos con conexiones HTTP keep-alive) contra una API
+en ejecución y reporta peticiones por segundo y latencias para cada nivel de concurrencia.
+
+Uso:
+    python benchmarks/concurrencia.py --url http://localhost:8000 --niveles 1 16 128 \\
+        --duracion 10 --etiqueta despues --salida resultados_concurrencia.json
+
+Para comparar antes/después ejecutar el mismo comando con la API levantada desde
+cada commit y cambiar `--etiqueta`; los resultados se agregan al archivo de salida.
+"""
+import argparse
+import http.client
+import json
+import os
+import statistics
+import threading
+import time
+from urllib.parse import urlparse
+
+
+def percentil(valores, p):
+    """Percentil `p` (0-100) de una lista ya ordenada"""
+    if not valores:
+        return 0.0
+    k = (len(valores) - 1) * p / 100
+    inferior = int(k)
+    superior = min(inferior + 1, len(valores) - 1)
+    return valores[inferior] + (valores[superior] - valores[inferior]) * (k - inferior)
+
+
+def crear_item_de_prueba(url):
+    """Crear un item para consultar durante el benchmark y devolver su ID"""
+    destino = urlparse(url)
+    conn = http.client.HTTPConnection(destino.hostname, destino.port or 80, timeout=30)
+    cuerpo = json.dumps({
+        "nombre": "Item benchmark concurrencia",
+        "categoria": "Benchmark",
+        "cantidad": 100,
+        "precioUnitario": 9.99,
+    })
+    conn.request("POST", "/api/inventario", cuerpo, {"Content-Type": "application/json"})
+    respuesta = conn.getresponse()
+    datos = json.loads(respuesta.read())
+    conn.close()
+    if respuesta.status != 201:
+        raise SystemExit(f"No se pudo crear el item de prueba: {respuesta.status} {datos}")
+    return datos["id"]
+
+
+def ejecutar_nivel(url, ruta, concurrencia, duracion):
+    """Ejecutar `concurrencia` clientes durante `duracion` segundos"""
+    destino = urlparse(url)
+    latencias = []
+    errores = [0]
+    lock = threading.Lock()
+    inicio_barrera = threading.Barrier(concurrencia + 1)
+    fin = [0.0]
+
+    def cliente():
+        conn = http.client.HTTPConnection(destino.hostname, destino.port or 80, timeout=30)
+        propias = []
+        fallos = 0
+        inicio_barrera.wait()
+        while time.perf_counter() < fin[0]:
+            t0 = time.perf_counter()
+            try:
+                conn.request("GET", ruta)
+                respuesta = conn.getresponse()
+                respuesta.read()
+                if respuesta.status != 200:
+                    fallos += 1
+            except Exception:
+                fallos += 1
+                conn.close()
+                conn = http.client.HTTPConnection(destino.hostname, destino.port or 80, timeout=30)
+                continue
+            propias.append(time.perf_counter() - t0)
+        conn.close()
+        with lock:
+            latencias.extend(propias)
+            errores[0] += fallos
+
+    hilos = [threading.Thread(target=cliente) for _ in range(concurrencia)]
+    for hilo in hilos:
+        hilo.start()
+    inicio = time.perf_counter()
+    fin[0] = inicio + duracion
+    inicio_barrera.wait()
+    for hilo in hilos:
+        hilo.join()
+    transcurrido = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "concurrencia": concurrencia,
+        "peticiones": len(latencias),
+        "errores": errores[0],
+        "peticiones_por_segundo": round(len(latencias) / transcurrido, 2),
+        "latencia_ms": {
+            "p50": round(percentil(latencias, 50) * 1000, 3),
+            "p95": round(percentil(latencias, 95) * 1000, 3),
+            "p99": round(percentil(latencias, 99) * 1000, 3),
+            "media": round(statistics.fmean(latencias) * 1000, 3) if latencias else 0.0,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.getenv("BASE_URL", "http://localhost:8000"))
+    parser.add_argument("--item-id", type=int, help="ID a consultar (por defecto se crea uno)")
+    parser.add_argument("--niveles", type=int, nargs="+", default=[1, 16, 128])
+    parser.add_argument("--duracion", type=float, default=10, help="Segundos por nivel")
+    parser.add_argument("--etiqueta", default="actual", help="Nombre de la corrida (p. ej. antes/despues)")
+    parser.add_argument("--salida", default="resultados_concurrencia.json")
+    args = parser.parse_args()
+
+    item_id = args.item_id or crear_item_de_prueba(args.url)
+    ruta = f"/api/inventario/{item_id}"
+
+    resultados = []
+    for nivel in args.niveles:
+        resultado = ejecutar_nivel(args.url, ruta, nivel, args.duracion)
+        resultados.append(resultado)
+        print(
+            f"{nivel:>4} clientes: {resultado['peticiones_por_segundo']:>10} req/s  "
+            f"p50={resultado['latencia_ms']['p50']}ms  p99={resultado['latencia_ms']['p99']}ms  "
+            f"errores={resultado['errores']}"
+        )
+
+    historial = {}
+    if os.path.exists(args.salida):
+        with open(args.salida) as archivo:
+            historial = json.load(archivo)
+    historial[args.etiqueta] = {"ruta": "/api/inventario/{item_id}", "niveles": resultados}
+    with open(args.salida, "w") as archivo:
+        json.dump(historial, archivo, indent=2)
+    print(f"Resultados guardados en {args.salida} (etiqueta '{args.etiqueta}')")
+
+
+if __name__ == "__main__":
+    main()
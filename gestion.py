@@ -0,0 +1,160 @@
+"""
+Comandos de administración del Sistema de Gestión de Inventario
+
+Uso:
+    python gestion.py importar inventario.csv
+    python gestion.py importar inventario.ndjson --formato ndjson
+    python gestion.py reconstruir-estadisticas
+    python gestion.py migrar
+    python gestion.py migrar --estado
+    python gestion.py particionar --particiones 16
+    python gestion.py particionar --particiones 0
+"""
+import argparse
+import os
+import sys
+import time
+
+import psycopg2
+
+from main import (
+    DATABASE_URL,
+    aplicar_migraciones,
+    cambiar_particiones,
+    importar_archivo,
+    listar_migraciones,
+    particiones_actuales,
+    reconstruir_estadisticas,
+    version_esquema,
+)
+
+
+def comando_importar(args):
+    """Importar un archivo CSV/NDJSON con COPY mostrando el progreso"""
+    formato = args.formato or ("ndjson" if args.archivo.endswith((".ndjson", ".jsonl")) else "csv")
+    total = os.path.getsize(args.archivo)
+
+    def progreso(leidos):
+        porcentaje = leidos * 100 / total if total else 100
+        print(f"\r📦 Cargando {args.archivo}: {porcentaje:5.1f}% ({leidos / 1_048_576:,.1f} MB)", end="", flush=True)
+
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        with open(args.archivo, "rb") as archivo:
+            resultado = importar_archivo(conn, archivo, formato, progreso)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print()
+    print(f"✅ Filas leídas: {resultado.filas_leidas}")
+    print(f"   Insertados: {resultado.insertados}")
+    print(f"   Actualizados: {resultado.actualizados}")
+    print(f"   Duplicadas en el archivo (gana la última): {resultado.filas_duplicadas}")
+    if resultado.filas_invalidas:
+        print(f"⚠️  Filas inválidas: {resultado.filas_invalidas} (primeras: {resultado.lineas_invalidas[:20]})")
+
+
+def comando_reconstruir_estadisticas(args):
+    """Recalcular los totales por categoría desde item_inventario"""
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        categorias = reconstruir_estadisticas(conn)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    print(f"✅ Estadísticas reconstruidas: {categorias} categorías")
+
+
+def comando_migrar(args):
+    """Aplicar las migraciones pendientes (o mostrar el estado con --estado)"""
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        if args.estado:
+            version = version_esquema(conn)
+            for numero, nombre, _ in listar_migraciones():
+                marca = "✅" if numero <= version else "⏳"
+                print(f"{marca} {numero:04d}_{nombre}")
+            return
+        aplicadas = aplicar_migraciones(
+            conn, progreso=lambda numero, nombre: print(f"⏳ Aplicando {numero:04d}_{nombre}...")
+        )
+    finally:
+        conn.close()
+    if aplicadas:
+        print(f"✅ Migraciones aplicadas: {', '.join(aplicadas)}")
+    else:
+        print("✅ El esquema ya está al día")
+
+
+def comando_particionar(args):
+    """Cambiar la distribución de item_inventario (particionada por categoría o tabla simple)"""
+    if args.particiones < 0:
+        print("❌ --particiones debe ser 0 o mayor", file=sys.stderr)
+        sys.exit(1)
+    conn = psycopg2.connect(DATABASE_URL)
+    try:
+        esperada = listar_migraciones()[-1][0]
+        if version_esquema(conn) < esperada:
+            print("❌ Aplicar antes las migraciones pendientes: python gestion.py migrar", file=sys.stderr)
+            sys.exit(1)
+        actuales = particiones_actuales(conn)
+        if actuales == args.particiones:
+            print(f"✅ item_inventario ya tiene esa distribución ({actuales or 'sin'} particiones)")
+            return
+        inicio = time.perf_counter()
+        filas = cambiar_particiones(conn, args.particiones, progreso=lambda mensaje: print(f"⏳ {mensaje}"))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    distribucion = f"{args.particiones} particiones" if args.particiones else "tabla simple"
+    print(f"✅ item_inventario reconstruida como {distribucion}: {filas} filas en {time.perf_counter() - inicio:.1f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Administración del inventario")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    importar = subcomandos.add_parser("importar", help="Importar un archivo CSV o NDJSON con COPY")
+    importar.add_argument("archivo")
+    importar.add_argument("--formato", choices=["csv", "ndjson"], help="Por defecto según la extensión")
+    importar.set_defaults(funcion=comando_importar)
+
+    reconstruir = subcomandos.add_parser(
+        "reconstruir-estadisticas", help="Recalcular las estadísticas por categoría desde cero"
+    )
+    reconstruir.set_defaults(funcion=comando_reconstruir_estadisticas)
+
+    migrar = subcomandos.add_parser(
+        "migrar", help="Aplicar las migraciones pendientes de migraciones/ (índices con CONCURRENTLY)"
+    )
+    migrar.add_argument("--estado", action="store_true", help="Solo mostrar qué migraciones están aplicadas")
+    migrar.set_defaults(funcion=comando_migrar)
+
+    particionar = subcomandos.add_parser(
+        "particionar", help="Particionar item_inventario por HASH de la categoría (bloquea escrituras)"
+    )
+    particionar.add_argument(
+        "--particiones", type=int, default=16, help="Cantidad de particiones (0 = volver a una tabla simple)"
+    )
+    particionar.set_defaults(funcion=comando_particionar)
+
+    args = parser.parse_args()
+    try:
+        args.funcion(args)
+    except psycopg2.Error as e:
+        print(f"\n❌ Error de base de datos: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Configuración de producción: gunicorn con workers de uvicorn
+
+    gunicorn main:app -c gunicorn.conf.py
+
+- WEB_CONCURRENCY: cantidad de workers (por defecto, los núcleos disponibles para el proceso)
+- DB_CONEXIONES_TOTALES: conexiones a PostgreSQL para toda la instancia; main.py las reparte
+  entre los workers (ver DB_POOL_MAX)
+- GRACEFUL_TIMEOUT: segundos que se esperan las peticiones en curso tras SIGTERM
+- FORWARDED_ALLOW_IPS: proxies de confianza para tomar la IP del cliente de X-Forwarded-For
+"""
+import os
+
+
+def _nucleos():
+    # Respeta los límites de CPU asignados al contenedor/proceso cuando el sistema los expone
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+workers = int(os.getenv("WEB_CONCURRENCY", _nucleos()))
+# Los workers leen WEB_CONCURRENCY para dimensionar su pool de conexiones
+os.environ["WEB_CONCURRENCY"] = str(workers)
+
+bind = f"0.0.0.0:{os.getenv('PORT', 8000)}"
+# Proxies cuyo X-Forwarded-For se acepta como IP del cliente (límites por IP, logs).
+# En Railway, Render o Heroku el tráfico llega siempre desde el proxy: FORWARDED_ALLOW_IPS="*"
+forwarded_allow_ips = os.getenv("FORWARDED_ALLOW_IPS", "127.0.0.1")
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# Cada worker abre su propio pool después del fork: no precargar la aplicación
+preload_app = False
+
+# SIGTERM: dejar de aceptar conexiones, terminar las peticiones en curso y ejecutar el
+# shutdown de la aplicación (espera las consultas y cierra el pool) antes de salir
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", 30))
+timeout = int(os.getenv("WORKER_TIMEOUT", 60))
+keepalive = int(os.getenv("KEEPALIVE", 5))
+
+# Reciclar workers periódicamente (0 = nunca); el jitter evita que se reinicien todos a la vez
+max_requests = int(os.getenv("MAX_REQUESTS", 0))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", 0))
+
+accesslog = "-" if os.getenv("ACCESS_LOG", "false").lower() == "true" else None
+errorlog = "-"
+
+
+def on_starting(server):
+    print(f"✅ Iniciando {workers} workers en {bind}")
@@ -0,0 +1,13 @@
+-- Tabla de items de inventario e índices originales
+CREATE TABLE IF NOT EXISTS item_inventario (
+    id SERIAL PRIMARY KEY,
+    nombre VARCHAR(255) NOT NULL,
+    categoria VARCHAR(100) NOT NULL,
+    cantidad INTEGER NOT NULL DEFAULT 0 CHECK (cantidad >= 0),
+    precio_unitario DECIMAL(10, 2) NOT NULL CHECK (precio_unitario > 0),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_categoria ON item_inventario(categoria);
+CREATE INDEX IF NOT EXISTS idx_nombre ON item_inventario(nombre);
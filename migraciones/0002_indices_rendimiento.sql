@@ -0,0 +1,18 @@
+-- sin-transaccion
+-- Índices ajustados a la forma exacta de las consultas, creados sin bloquear escrituras:
+-- - búsqueda por categoría: igualdad sobre LOWER(categoria) y orden por (nombre, id)
+-- - bajo stock: rango sobre cantidad y orden por (cantidad, nombre, id)
+-- - búsqueda por texto: trigramas (pg_trgm) sobre nombre y categoría
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_categoria_lower_nombre
+    ON item_inventario (LOWER(categoria), nombre, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_cantidad_nombre
+    ON item_inventario (cantidad, nombre, id);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nombre_trgm
+    ON item_inventario USING gin (nombre gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_categoria_trgm
+    ON item_inventario USING gin (categoria gin_trgm_ops);
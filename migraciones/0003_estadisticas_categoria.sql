@@ -0,0 +1,94 @@
+-- Estadísticas por categoría mantenidas por triggers a nivel de sentencia: cada INSERT/UPDATE/DELETE
+-- sobre item_inventario (incluidos lotes e importaciones) aplica sus deltas agregados por categoría
+-- usando las tablas de transición, así los endpoints de estadísticas leen O(categorías) filas.
+
+CREATE TABLE IF NOT EXISTS estadisticas_categoria (
+    categoria VARCHAR(100) PRIMARY KEY,
+    total_items BIGINT NOT NULL DEFAULT 0,
+    total_unidades BIGINT NOT NULL DEFAULT 0,
+    valor_total NUMERIC NOT NULL DEFAULT 0,
+    suma_precios NUMERIC NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION actualizar_estadisticas_categoria() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO estadisticas_categoria AS e
+            (categoria, total_items, total_unidades, valor_total, suma_precios)
+        SELECT categoria, count(*), sum(cantidad), sum(cantidad * precio_unitario), sum(precio_unitario)
+        FROM nuevos
+        GROUP BY categoria
+        ORDER BY categoria
+        ON CONFLICT (categoria) DO UPDATE SET
+            total_items = e.total_items + EXCLUDED.total_items,
+            total_unidades = e.total_unidades + EXCLUDED.total_unidades,
+            valor_total = e.valor_total + EXCLUDED.valor_total,
+            suma_precios = e.suma_precios + EXCLUDED.suma_precios;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO estadisticas_categoria AS e
+            (categoria, total_items, total_unidades, valor_total, suma_precios)
+        SELECT categoria, -count(*), -sum(cantidad), -sum(cantidad * precio_unitario), -sum(precio_unitario)
+        FROM viejos
+        GROUP BY categoria
+        ORDER BY categoria
+        ON CONFLICT (categoria) DO UPDATE SET
+            total_items = e.total_items + EXCLUDED.total_items,
+            total_unidades = e.total_unidades + EXCLUDED.total_unidades,
+            valor_total = e.valor_total + EXCLUDED.valor_total,
+            suma_precios = e.suma_precios + EXCLUDED.suma_precios;
+        DELETE FROM estadisticas_categoria
+        WHERE total_items <= 0 AND categoria IN (SELECT categoria FROM viejos);
+    ELSE
+        INSERT INTO estadisticas_categoria AS e
+            (categoria, total_items, total_unidades, valor_total, suma_precios)
+        SELECT categoria, sum(items), sum(unidades), sum(valor), sum(precios)
+        FROM (
+            SELECT categoria, 1 AS items, cantidad AS unidades,
+                   cantidad * precio_unitario AS valor, precio_unitario AS precios
+            FROM nuevos
+            UNION ALL
+            SELECT categoria, -1, -cantidad, -cantidad * precio_unitario, -precio_unitario
+            FROM viejos
+        ) AS delta
+        GROUP BY categoria
+        HAVING sum(items) <> 0 OR sum(unidades) <> 0 OR sum(valor) <> 0 OR sum(precios) <> 0
+        ORDER BY categoria
+        ON CONFLICT (categoria) DO UPDATE SET
+            total_items = e.total_items + EXCLUDED.total_items,
+            total_unidades = e.total_unidades + EXCLUDED.total_unidades,
+            valor_total = e.valor_total + EXCLUDED.valor_total,
+            suma_precios = e.suma_precios + EXCLUDED.suma_precios;
+        DELETE FROM estadisticas_categoria
+        WHERE total_items <= 0 AND categoria IN (SELECT categoria FROM viejos);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_estadisticas_insert') THEN
+        CREATE TRIGGER trg_estadisticas_insert AFTER INSERT ON item_inventario
+            REFERENCING NEW TABLE AS nuevos
+            FOR EACH STATEMENT EXECUTE FUNCTION actualizar_estadisticas_categoria();
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_estadisticas_update') THEN
+        CREATE TRIGGER trg_estadisticas_update AFTER UPDATE ON item_inventario
+            REFERENCING OLD TABLE AS viejos NEW TABLE AS nuevos
+            FOR EACH STATEMENT EXECUTE FUNCTION actualizar_estadisticas_categoria();
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_estadisticas_delete') THEN
+        CREATE TRIGGER trg_estadisticas_delete AFTER DELETE ON item_inventario
+            REFERENCING OLD TABLE AS viejos
+            FOR EACH STATEMENT EXECUTE FUNCTION actualizar_estadisticas_categoria();
+    END IF;
+END;
+$$;
+
+-- Carga inicial (solo si la tabla de estadísticas está vacía)
+INSERT INTO estadisticas_categoria
+    (categoria, total_items, total_unidades, valor_total, suma_precios)
+SELECT categoria, count(*), sum(cantidad), sum(cantidad * precio_unitario), sum(precio_unitario)
+FROM item_inventario
+WHERE NOT EXISTS (SELECT 1 FROM estadisticas_categoria)
+GROUP BY categoria;
@@ -0,0 +1,56 @@
+-- Feed de cambios para sincronización incremental (GET /api/inventario/cambios)
+
+-- updated_at siempre es el inicio de la transacción que modificó la fila, aunque la
+-- sentencia no lo asigne: el feed depende de esto para no saltarse cambios
+CREATE OR REPLACE FUNCTION asignar_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at = CURRENT_TIMESTAMP;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Lápidas de los items eliminados, para que los clientes también sincronicen las bajas
+CREATE TABLE IF NOT EXISTS item_eliminado (
+    id INTEGER PRIMARY KEY,
+    eliminado_en TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_item_eliminado_cambio ON item_eliminado (eliminado_en, id);
+
+CREATE OR REPLACE FUNCTION registrar_items_eliminados() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO item_eliminado (id)
+    SELECT id FROM viejos
+    ORDER BY id
+    ON CONFLICT (id) DO UPDATE SET eliminado_en = EXCLUDED.eliminado_en;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Aviso (sin datos) para los clientes conectados por SSE; se entrega al confirmar
+CREATE OR REPLACE FUNCTION notificar_cambio_inventario() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('inventario_cambios', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_asignar_updated_at') THEN
+        CREATE TRIGGER trg_asignar_updated_at BEFORE UPDATE ON item_inventario
+            FOR EACH ROW EXECUTE FUNCTION asignar_updated_at();
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_items_eliminados') THEN
+        CREATE TRIGGER trg_items_eliminados AFTER DELETE ON item_inventario
+            REFERENCING OLD TABLE AS viejos
+            FOR EACH STATEMENT EXECUTE FUNCTION registrar_items_eliminados();
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_notificar_cambio') THEN
+        CREATE TRIGGER trg_notificar_cambio AFTER INSERT OR UPDATE OR DELETE ON item_inventario
+            FOR EACH STATEMENT EXECUTE FUNCTION notificar_cambio_inventario();
+    END IF;
+END;
+$$;
+
+-- Filas antiguas sin updated_at: sin esto nunca aparecerían en el feed
+UPDATE item_inventario SET updated_at = COALESCE(created_at, CURRENT_TIMESTAMP) WHERE updated_at IS NULL;
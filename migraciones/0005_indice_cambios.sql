@@ -0,0 +1,4 @@
+-- sin-transaccion
+-- Recorrido del feed de cambios por (updated_at, id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_updated_at_id
+    ON item_inventario (updated_at, id);
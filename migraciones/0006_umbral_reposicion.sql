@@ -0,0 +1,56 @@
+-- Umbral de reposición por item y aviso (NOTIFY) cuando un item cruza su umbral
+
+-- Con un DEFAULT constante no se reescribe la tabla; la restricción se valida en la
+-- siguiente migración sin bloquear escrituras
+ALTER TABLE item_inventario ADD COLUMN IF NOT EXISTS umbral_reposicion INTEGER NOT NULL DEFAULT 0;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint
+        WHERE conname = 'item_inventario_umbral_reposicion_check'
+          AND conrelid = 'item_inventario'::regclass
+    ) THEN
+        ALTER TABLE item_inventario ADD CONSTRAINT item_inventario_umbral_reposicion_check
+            CHECK (umbral_reposicion >= 0) NOT VALID;
+    END IF;
+END;
+$$;
+
+-- Un aviso por item que pasa a estar bajo su umbral ('bajo') o que vuelve a estar por
+-- encima ('repuesto'); las escrituras que no cruzan el umbral no generan avisos
+CREATE OR REPLACE FUNCTION notificar_alertas_reposicion() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        PERFORM pg_notify('inventario_alertas', json_build_object(
+            'estado', 'bajo', 'id', n.id, 'nombre', n.nombre, 'categoria', n.categoria,
+            'cantidad', n.cantidad, 'umbralReposicion', n.umbral_reposicion)::text)
+        FROM nuevos n
+        WHERE n.cantidad < n.umbral_reposicion
+        ORDER BY n.id;
+    ELSE
+        PERFORM pg_notify('inventario_alertas', json_build_object(
+            'estado', CASE WHEN n.cantidad < n.umbral_reposicion THEN 'bajo' ELSE 'repuesto' END,
+            'id', n.id, 'nombre', n.nombre, 'categoria', n.categoria,
+            'cantidad', n.cantidad, 'umbralReposicion', n.umbral_reposicion)::text)
+        FROM nuevos n JOIN viejos v ON v.id = n.id
+        WHERE (n.cantidad < n.umbral_reposicion) <> (v.cantidad < v.umbral_reposicion)
+        ORDER BY n.id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_alertas_insert') THEN
+        CREATE TRIGGER trg_alertas_insert AFTER INSERT ON item_inventario
+            REFERENCING NEW TABLE AS nuevos
+            FOR EACH STATEMENT EXECUTE FUNCTION notificar_alertas_reposicion();
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_trigger WHERE tgname = 'trg_alertas_update') THEN
+        CREATE TRIGGER trg_alertas_update AFTER UPDATE ON item_inventario
+            REFERENCING OLD TABLE AS viejos NEW TABLE AS nuevos
+            FOR EACH STATEMENT EXECUTE FUNCTION notificar_alertas_reposicion();
+    END IF;
+END;
+$$;
@@ -0,0 +1,7 @@
+-- sin-transaccion
+-- Validar el umbral sin bloquear escrituras (SHARE UPDATE EXCLUSIVE)
+ALTER TABLE item_inventario VALIDATE CONSTRAINT item_inventario_umbral_reposicion_check;
+-- Índice parcial con solo los items bajo su umbral: GET /api/inventario/alertas lee este
+-- conjunto (normalmente pequeño) sin recorrer la tabla
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bajo_umbral
+    ON item_inventario (id) WHERE cantidad < umbral_reposicion;
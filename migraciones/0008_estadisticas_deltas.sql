@@ -0,0 +1,99 @@
+-- Estadísticas por categoría sin filas calientes: los triggers ya no actualizan la fila de
+-- cada categoría en estadisticas_categoria (el lock de esa fila duraba hasta el COMMIT, así
+-- que un lote o una importación grande frenaba las escrituras sueltas de sus categorías y
+-- dos lotes de varias sentencias podían bloquearse mutuamente). Ahora cada sentencia agrega
+-- sus deltas a estadisticas_categoria_delta (solo INSERT, sin esperas entre escritores),
+-- las lecturas suman la tabla base y los deltas pendientes, y compactar_estadisticas_categoria()
+-- los traslada periódicamente a la tabla base.
+
+CREATE TABLE IF NOT EXISTS estadisticas_categoria_delta (
+    id BIGSERIAL PRIMARY KEY,
+    categoria VARCHAR(100) NOT NULL,
+    total_items BIGINT NOT NULL,
+    total_unidades BIGINT NOT NULL,
+    valor_total NUMERIC NOT NULL,
+    suma_precios NUMERIC NOT NULL
+);
+
+CREATE OR REPLACE FUNCTION actualizar_estadisticas_categoria() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO estadisticas_categoria_delta
+            (categoria, total_items, total_unidades, valor_total, suma_precios)
+        SELECT categoria, count(*), sum(cantidad), sum(cantidad * precio_unitario), sum(precio_unitario)
+        FROM nuevos
+        GROUP BY categoria;
+    ELSIF TG_OP = 'DELETE' THEN
+        INSERT INTO estadisticas_categoria_delta
+            (categoria, total_items, total_unidades, valor_total, suma_precios)
+        SELECT categoria, -count(*), -sum(cantidad), -sum(cantidad * precio_unitario), -sum(precio_unitario)
+        FROM viejos
+        GROUP BY categoria;
+    ELSE
+        INSERT INTO estadisticas_categoria_delta
+            (categoria, total_items, total_unidades, valor_total, suma_precios)
+        SELECT categoria, sum(items), sum(unidades), sum(valor), sum(precios)
+        FROM (
+            SELECT categoria, 1 AS items, cantidad AS unidades,
+                   cantidad * precio_unitario AS valor, precio_unitario AS precios
+            FROM nuevos
+            UNION ALL
+            SELECT categoria, -1, -cantidad, -cantidad * precio_unitario, -precio_unitario
+            FROM viejos
+        ) AS delta
+        GROUP BY categoria
+        HAVING sum(items) <> 0 OR sum(unidades) <> 0 OR sum(valor) <> 0 OR sum(precios) <> 0;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Totales vigentes: tabla base más los deltas aún no compactados
+CREATE OR REPLACE VIEW estadisticas_categoria_actual AS
+SELECT categoria,
+       sum(total_items) AS total_items,
+       sum(total_unidades) AS total_unidades,
+       sum(valor_total) AS valor_total,
+       sum(suma_precios) AS suma_precios
+FROM (
+    SELECT categoria, total_items, total_unidades, valor_total, suma_precios FROM estadisticas_categoria
+    UNION ALL
+    SELECT categoria, total_items, total_unidades, valor_total, suma_precios FROM estadisticas_categoria_delta
+) AS totales
+GROUP BY categoria
+HAVING sum(total_items) > 0;
+
+-- Traslada los deltas confirmados a la tabla base y retorna cuántas categorías actualizó.
+-- Solo esta función (y `gestion.py reconstruir-estadisticas`) bloquea filas de
+-- estadisticas_categoria; con el advisory lock una segunda compactación simultánea no hace
+-- nada en lugar de esperar. Los deltas de transacciones en curso no son visibles y quedan
+-- para la siguiente compactación.
+CREATE OR REPLACE FUNCTION compactar_estadisticas_categoria() RETURNS BIGINT AS $$
+DECLARE
+    categorias BIGINT;
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('compactar_estadisticas_categoria')) THEN
+        RETURN 0;
+    END IF;
+
+    WITH movidos AS (
+        DELETE FROM estadisticas_categoria_delta
+        RETURNING categoria, total_items, total_unidades, valor_total, suma_precios
+    )
+    INSERT INTO estadisticas_categoria AS e
+        (categoria, total_items, total_unidades, valor_total, suma_precios)
+    SELECT categoria, sum(total_items), sum(total_unidades), sum(valor_total), sum(suma_precios)
+    FROM movidos
+    GROUP BY categoria
+    ORDER BY categoria
+    ON CONFLICT (categoria) DO UPDATE SET
+        total_items = e.total_items + EXCLUDED.total_items,
+        total_unidades = e.total_unidades + EXCLUDED.total_unidades,
+        valor_total = e.valor_total + EXCLUDED.valor_total,
+        suma_precios = e.suma_precios + EXCLUDED.suma_precios;
+    GET DIAGNOSTICS categorias = ROW_COUNT;
+
+    DELETE FROM estadisticas_categoria WHERE total_items <= 0;
+    RETURN categorias;
+END;
+$$ LANGUAGE plpgsql;
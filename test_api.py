@@ -1,8 +1,9 @@
 import requests
 import json
+import os
 
-# Configurar la URL base (cambia esto por tu URL de Railway cuando despliegues)
-BASE_URL = "http://localhost:8000"
+# Configurar la URL base con la variable de entorno BASE_URL (p. ej. tu URL de Railway)
+BASE_URL = os.getenv("BASE_URL", "http://localhost:8000")
 
 print("🧪 Probando Sistema de Gestión de Inventario")
 print("=" * 60)
@@ -179,6 +180,87 @@ if len(created_ids) > 1:
         print(f"   ✅ Eliminado: {result['nombre']} (ID: {result['id']})")
 print()
 
+# Test 12: Operaciones por lotes
+print("1️⃣2️⃣ Operaciones por lotes...")
+lote = [
+    {"nombre": "Cable HDMI 2m", "categoria": "Accesorios", "cantidad": 100, "precioUnitario": 9.99},
+    {"nombre": "Hub USB-C", "categoria": "Accesorios", "cantidad": 30, "precioUnitario": 39.99},
+    {"nombre": "", "categoria": "Accesorios", "cantidad": -1, "precioUnitario": 0},
+]
+response = requests.post(f"{BASE_URL}/api/inventario/lote", json=lote)
+resultado = response.json()
+lote_ids = resultado["ids"]
+print(f"   Status: {response.status_code}")
+print(f"   ✅ Creados: {resultado['procesados']} (IDs: {lote_ids})")
+print(f"   ⚠️  Rechazados: {[error['indice'] for error in resultado['errores']]}")
+if lote_ids:
+    response = requests.put(
+        f"{BASE_URL}/api/inventario/lote",
+        json=[{"id": item_id, "cantidad": 75} for item_id in lote_ids],
+    )
+    print(f"   ✅ Actualizados: {response.json()['procesados']}")
+    response = requests.request("DELETE", f"{BASE_URL}/api/inventario/lote", json=lote_ids)
+    print(f"   ✅ Eliminados: {response.json()['procesados']}")
+print()
+
+# Test 13: Importar un archivo CSV
+print("1️⃣3️⃣ Importando un archivo CSV...")
+csv_importacion = (
+    "nombre,categoria,cantidad,precioUnitario\n"
+    "Webcam Logitech C920,Tecnología,12,79.99\n"
+    "Fila inválida,Tecnología,-5,10\n"
+)
+response = requests.post(
+    f"{BASE_URL}/api/inventario/importar?formato=csv",
+    data=csv_importacion.encode("utf-8"),
+    headers={"Content-Type": "text/csv"},
+)
+resultado = response.json()
+print(f"   Status: {response.status_code}")
+print(f"   Filas leídas: {resultado['filas_leidas']}")
+print(f"   Insertados: {resultado['insertados']}, actualizados: {resultado['actualizados']}")
+print(f"   ⚠️  Filas inválidas: {resultado['lineas_invalidas']}")
+print()
+
+# Test 14: Movimientos de stock
+print("1️⃣4️⃣ Registrando movimientos de stock...")
+if created_ids:
+    item_id = created_ids[0]
+    response = requests.post(f"{BASE_URL}/api/inventario/{item_id}/movimientos", json={"delta": -2})
+    print(f"   Status: {response.status_code}")
+    print(f"   ✅ Venta de 2 unidades: quedan {response.json()['cantidad']}")
+    response = requests.post(
+        f"{BASE_URL}/api/inventario/movimientos",
+        json=[{"item_id": item_id, "delta": 5}, {"item_id": item_id, "delta": -100000}],
+    )
+    resultado = response.json()
+    for aplicado in resultado["aplicados"]:
+        print(f"   ✅ Item {aplicado['item_id']}: {aplicado['cantidad']} unidades")
+    for error in resultado["errores"]:
+        print(f"   ⚠️  Movimiento {error['indice']} rechazado: {error['detalle']}")
+print()
+
+# Test 15: Feed de cambios
+print("1️⃣5️⃣ Leyendo el feed de cambios...")
+response = requests.get(f"{BASE_URL}/api/inventario/cambios?limit=5")
+pagina = response.json()
+print(f"   Status: {response.status_code}")
+for cambio in pagina["cambios"]:
+    print(f"   - {cambio['tipo']}: item {cambio['id']} ({cambio['cambiado_en']})")
+print(f"   Siguiente token: {pagina['siguiente']} (hay más: {pagina['hay_mas']})")
+print()
+
+# Test 16: Alertas de reposición
+print("1️⃣6️⃣ Alertas de reposición...")
+if len(created_ids) > 1:
+    item_id = created_ids[1]
+    requests.put(f"{BASE_URL}/api/inventario/{item_id}", json={"umbralReposicion": 100})
+    response = requests.get(f"{BASE_URL}/api/inventario/alertas")
+    print(f"   Status: {response.status_code}")
+    for item in response.json():
+        print(f"   🔔 {item['nombre']}: {item['cantidad']} unidades (umbral {item['umbralReposicion']})")
+print()
+
 # Resumen final
 print("=" * 60)
 print("✅ Pruebas completadas exitosamente!")